@@ -38,12 +38,13 @@ from typing import TYPE_CHECKING, Callable
 from urllib.request import urlretrieve
 
 import sgtk
+from sgtk.platform.qt5 import QtCore
 
 from .external import parse_exr_metadata
 from .models import (
     Deliverables,
     ExportShotsThread,
-    LoadShotsThread,
+    LoadShotsRunnable,
     NukeProcess,
     Settings,
     Shot,
@@ -60,7 +61,6 @@ from .models.util import (
     EXR_COMPRESSION,
     NUKE_EXR_COMPRESSION,
 )
-from .models.version import Task
 
 if TYPE_CHECKING:
     from .models.shotgrid_cache import ShotGridCache
@@ -77,7 +77,7 @@ class DeliveryModel:
     shots_to_deliver: None | list[Shot]
     assets_to_deliver: None | list[Asset]
     base_template_fields: dict
-    load_shots_thread: None | LoadShotsThread
+    load_shots_runnable: None | LoadShotsRunnable
     export_shots_thread: None | ExportShotsThread
 
     cache: ShotGridCache
@@ -94,7 +94,7 @@ class DeliveryModel:
         self.shotgrid_connection = app.shotgun
         self.logger = app.logger
         self.shots_to_deliver = None
-        self.load_shots_thread = None
+        self.load_shots_runnable = None
         self.export_shots_thread = None
 
         self.settings = controller.settings
@@ -147,9 +147,8 @@ class DeliveryModel:
         """
         Cancel running threads before app quit
         """
-        if self.load_shots_thread and self.load_shots_thread.isRunning():
-            self.load_shots_thread.terminate()
-
+        # Shot loads run on the shared thread pool and can't be
+        # terminated; a pending load just finishes on its own.
         if self.export_shots_thread and self.export_shots_thread.isRunning():
             self.export_shots_thread.terminate()
 
@@ -173,16 +172,16 @@ class DeliveryModel:
             loading_shots_successful_function: Function that gets called when loading shots is successful.
             loading_shots_failed_function: Function that gets called when loading shots failed.
         """
-        self.load_shots_thread = LoadShotsThread(self)
+        self.load_shots_runnable = LoadShotsRunnable(self)
 
-        self.load_shots_thread.loading_shots_successful.connect(
+        self.load_shots_runnable.signals.loading_shots_successful.connect(
             loading_shots_successful_function
         )
-        self.load_shots_thread.loading_shots_failed.connect(
+        self.load_shots_runnable.signals.loading_shots_failed.connect(
             loading_shots_failed_function
         )
 
-        self.load_shots_thread.start()
+        QtCore.QThreadPool.globalInstance().start(self.load_shots_runnable)
 
     def get_versions_to_deliver(self) -> list[Shot | Asset]:
         """Gets a list of shots with versions that are ready for delivery.
@@ -415,9 +414,6 @@ class DeliveryModel:
             )
 
             for sg_version in sg_shot["versions"]:
-                first_frame = sg_version["sg_first_frame"]
-                last_frame = sg_version["sg_last_frame"]
-
                 published_file = self.get_version_published_file(sg_version)
                 sequence_path = ""
                 if (
@@ -437,13 +433,6 @@ class DeliveryModel:
                             "local_path_windows"
                         ]
 
-                task = None
-                if sg_version["sg_task"] is not None:
-                    task = Task(
-                        sg_version["sg_task"]["id"],
-                        sg_version["sg_task"]["name"],
-                    )
-
                 if (
                     sg_shot[self.settings.shot_status_field]
                     == self.settings.shot_delivery_status
@@ -454,40 +443,17 @@ class DeliveryModel:
                     deliver_preview = True
                     deliver_sequence = False
 
-                version = Version(
-                    id=sg_version["id"],
-                    code=sg_version["code"],
-                    first_frame=first_frame,
-                    last_frame=last_frame,
-                    fps=sg_version["sg_uploaded_movie_frame_rate"],
-                    thumbnail=sg_version["image"],
+                version = Version.from_sg(
+                    sg_version,
+                    self.settings,
                     sequence_path=sequence_path,
                     version_number=(
                         published_file["version_number"]
                         if published_file is not None
                         else -1
                     ),
-                    path_to_movie=sg_version["sg_path_to_movie"],
-                    frames_have_slate=sg_version["sg_frames_have_slate"],
-                    movie_has_slate=sg_version["sg_movie_has_slate"],
-                    submitting_for=sg_version.get(
-                        self.settings.submitting_for_field, ""
-                    ),
-                    submission_note=sg_version.get(
-                        self.settings.submission_note_field, ""
-                    ),
-                    submission_note_short=sg_version.get(
-                        self.settings.short_submission_note_field, ""
-                    ),
-                    attachment=sg_version.get(
-                        self.settings.attachment_field, ""
-                    ),
-                    task=task,
                     deliver_preview=deliver_preview,
                     deliver_sequence=deliver_sequence,
-                    sequence_output_status=sg_version.get(
-                        self.settings.delivery_sequence_outputs_field, ""
-                    ),
                 )
                 shot.add_version(version)
 
@@ -551,9 +517,6 @@ class DeliveryModel:
             )
 
             for sg_version in sg_asset["versions"]:
-                first_frame = sg_version["sg_first_frame"]
-                last_frame = sg_version["sg_last_frame"]
-
                 published_file = self.get_version_published_file(sg_version)
                 sequence_path = ""
                 if published_file is not None:
@@ -570,13 +533,6 @@ class DeliveryModel:
                             "local_path_windows"
                         ]
 
-                task = None
-                if sg_version["sg_task"] is not None:
-                    task = Task(
-                        sg_version["sg_task"]["id"],
-                        sg_version["sg_task"]["name"],
-                    )
-
                 # if (
                 #     sg_asset[self.settings.asset_status_field]
                 #     == self.settings.asset_delivery_status
@@ -587,40 +543,17 @@ class DeliveryModel:
                 deliver_preview = True
                 deliver_sequence = False
 
-                version = Version(
-                    id=sg_version["id"],
-                    code=sg_version["code"],
-                    first_frame=first_frame,
-                    last_frame=last_frame,
-                    fps=sg_version["sg_uploaded_movie_frame_rate"],
-                    thumbnail=sg_version["image"],
+                version = Version.from_sg(
+                    sg_version,
+                    self.settings,
                     sequence_path=sequence_path,
                     version_number=(
                         published_file["version_number"]
                         if published_file is not None
                         else -1
                     ),
-                    path_to_movie=sg_version["sg_path_to_movie"],
-                    frames_have_slate=sg_version["sg_frames_have_slate"],
-                    movie_has_slate=sg_version["sg_movie_has_slate"],
-                    submitting_for=sg_version.get(
-                        self.settings.submitting_for_field, ""
-                    ),
-                    submission_note=sg_version.get(
-                        self.settings.submission_note_field, ""
-                    ),
-                    submission_note_short=sg_version.get(
-                        self.settings.short_submission_note_field, ""
-                    ),
-                    attachment=sg_version.get(
-                        self.settings.attachment_field, ""
-                    ),
-                    task=task,
                     deliver_preview=deliver_preview,
                     deliver_sequence=deliver_sequence,
-                    sequence_output_status=sg_version.get(
-                        self.settings.delivery_sequence_outputs_field, ""
-                    ),
                 )
                 asset.add_version(version)
 
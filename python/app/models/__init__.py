@@ -1,7 +1,7 @@
 from .deliverables import Deliverables
 from .export_shots_thread import ExportShotsThread
 from .letterbox import Letterbox
-from .load_shots_thread import LoadShotsThread
+from .load_shots_thread import LoadShotsRunnable
 from .nuke_process import NukeProcess
 from .peview_output import PreviewOutput
 from .sequence_output import SequenceOutput
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -11,6 +12,8 @@ if TYPE_CHECKING:
 
 
 class Context:
+    __slots__ = ("shot", "version", "file", "entity", "cache")
+
     shot: Shot | None
     version: Version | None
     file: FileContext | None
@@ -32,35 +35,40 @@ class Context:
         self.entity = entity
         self.cache = cache
 
+    _KEYS = ("shot", "version", "entity", "file")
+    _KEY_SET = frozenset(_KEYS)
+
     @classmethod
     def get_keys(cls):
-        return ["shot", "version", "entity", "file"]
+        return cls._KEYS
 
     def __getitem__(self, key):
-        if key in self.get_keys():
-            if key == "shot":
-                return self.shot
-            if key == "version":
-                return self.version
-            if key == "entity":
-                return self.entity
-            if key == "file":
-                return self.file
+        # Single hash lookup + slot access instead of chained comparisons
+        if key in self._KEY_SET:
+            return getattr(self, key)
         msg = f"Key '{key}' not found."
         raise KeyError(msg)
 
     def as_dict(self) -> dict:
+        # Bind each slot once; the None checks reuse the locals
+        shot, version, file = self.shot, self.version, self.file
         return {
-            "shot": None if self.shot is None else self.shot.as_dict(),
-            "version": (
-                None if self.version is None else self.version.as_dict()
-            ),
-            "file": None if self.file is None else self.file.as_dict(),
-            "entity": None if self.entity is None else self.entity,
+            "shot": shot.as_dict() if shot is not None else None,
+            "version": version.as_dict() if version is not None else None,
+            "file": file.as_dict() if file is not None else None,
+            "entity": self.entity,
         }
 
 
 class FileContext:
+    __slots__ = (
+        "file_path",
+        "directory_path",
+        "codec",
+        "bit_depth",
+        "has_slate",
+    )
+
     file_path: Path | None
     directory_path: Path | None
     codec: str | None
@@ -77,12 +85,15 @@ class FileContext:
     ):
         self.file_path = file_path
         self.directory_path = directory_path
-        self.codec = codec
-        self.bit_depth = bit_depth
+        # Codec and bit depth repeat across files; intern to share storage
+        self.codec = sys.intern(codec) if codec else codec
+        self.bit_depth = sys.intern(bit_depth) if bit_depth else bit_depth
         self.has_slate = has_slate
 
+    _DICT_FIELDS = ("codec", "bit_depth", "has_slate")
+
     def as_dict(self) -> dict:
-        return {
+        data = {
             "file_path": (
                 None if self.file_path is None else self.file_path.as_posix()
             ),
@@ -91,10 +102,11 @@ class FileContext:
                 if self.directory_path is None
                 else self.directory_path.as_posix()
             ),
-            "codec": self.codec,
-            "bit_depth": self.bit_depth,
-            "has_slate": self.has_slate,
         }
+        data.update(
+            (key, getattr(self, key)) for key in self._DICT_FIELDS
+        )
+        return data
 
     def get(self, key: str):
         """
@@ -3,12 +3,20 @@ from __future__ import annotations
 from enum import Enum
 
 
-class EntityType(Enum):
+class EntityType(str, Enum):
+    """
+    Entity discriminator. Subclassing str keeps member comparisons as
+    plain string compares and lets values be used directly as the
+    ShotGrid entity type name.
+    """
+
     SHOT = "Shot"
     ASSET = "Asset"
 
 
 class Entity:
+    __slots__ = ("type",)
+
     type: EntityType
 
     def __init__(
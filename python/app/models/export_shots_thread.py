@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import csv
+import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable
 
 from sgtk.platform.qt5 import QtCore
+from tank.errors import TankError
 
 from .entity import EntityType
 from .util import compile_extra_template_fields, EXR_COMPRESSION
@@ -17,6 +22,7 @@ if TYPE_CHECKING:
     from .shot import Shot
 
 from .context import Context, FileContext
+from .field_template_string import _read_exr_header_cached
 from ..external import parse_exr_metadata
 
 # # For development only
@@ -26,6 +32,38 @@ from ..external import parse_exr_metadata
 #     pass
 
 
+# Compiled once at import; format_field runs per field per row
+_SANITIZE_RE = re.compile(r"[^\x20-\x7E\n\r\t]+")
+_SANITIZE_SUB = _SANITIZE_RE.sub
+
+# ASCII characters the sanitizer would strip; used to gate the regex
+_STRIPPED_ASCII = frozenset(
+    chr(code) for code in range(0x20) if chr(code) not in "\n\r\t"
+) | {"\x7f"}
+
+
+@lru_cache(maxsize=1024)
+def _exr_header(path: str) -> dict:
+    """
+    Cached EXR header read; versions that resolve to the same frame file
+    reuse the parsed header instead of re-reading it from disk.
+    """
+    return parse_exr_metadata.read_exr_header(path)
+
+
+@lru_cache(maxsize=4096)
+def _exists_cached(path: str) -> bool:
+    """
+    Cached existence check, so rows that resolve to files in the same
+    delivery don't stat() the same path repeatedly.
+    """
+    try:
+        Path(path).stat()
+    except OSError:
+        return False
+    return True
+
+
 class ExportShotsThread(QtCore.QThread):
     """Class for exporting shots on a separate thread
     so the UI doesn't freeze."""
@@ -50,15 +88,29 @@ class ExportShotsThread(QtCore.QThread):
         self.get_deliverables = get_deliverables
 
     def run(self):
-        version_deliverables = {}
-        episodes = []
+        # The delivery rewrites the files below, so drop stale existence
+        # checks and EXR headers cached from a previous run
+        _exists_cached.cache_clear()
+        _exr_header.cache_clear()
+        _read_exr_header_cached.cache_clear()
+
+        # One traversal builds the full delivery plan; the deliver loop
+        # and CSV generation below reuse it instead of re-walking every
+        # entity
+        delivery_plan = []
+        # Shots indexed per episode so each episode CSV only visits its
+        # own versions; assets are appended to every episode CSV
+        shot_plan_by_episode: dict[str | None, list] = {}
+        asset_plan = []
+        # Insertion-ordered dict used as a set for O(1) episode dedup
+        episodes: dict[str | None, None] = {}
 
         delivery_folder_template = self.model.app.get_template(
             "delivery_folder"
         )
         episode_folders = "Episode" in delivery_folder_template.keys
         if not episode_folders or len(self.model.assets_to_deliver):
-            episodes.append(None)
+            episodes[None] = None
 
         for entity in (
             self.model.shots_to_deliver + self.model.assets_to_deliver
@@ -70,23 +122,27 @@ class ExportShotsThread(QtCore.QThread):
                     deliverables.deliver_preview
                     or deliverables.deliver_sequence
                 ):
-                    version_deliverables[version.id] = deliverables
-                    if (
-                        entity.type == EntityType.SHOT
-                        and entity.episode not in episodes
-                    ):
-                        episodes.append(entity.episode)
+                    item = (entity, version, deliverables)
+                    delivery_plan.append(item)
+                    if entity.type == EntityType.SHOT:
+                        episodes.setdefault(entity.episode, None)
+                        shot_plan_by_episode.setdefault(
+                            entity.episode, []
+                        ).append(item)
+                    else:
+                        asset_plan.append(item)
 
         episode_delivery_versions = {}
 
         csv_episode_data = {}
 
-        for episode in episodes:
+        base_template_fields = self.model.base_template_fields
+
+        def compute_episode_fields(episode):
+            """Resolve the template fields and next delivery version for
+            one episode."""
             # Get latest delivery version
-            template_fields = {
-                **self.model.base_template_fields,
-                "Episode": episode,
-            }
+            template_fields = base_template_fields | {"Episode": episode}
 
             if self.user_settings.delivery_version is None:
                 fields = []
@@ -100,53 +156,81 @@ class ExportShotsThread(QtCore.QThread):
                 if self.user_settings.delivery_location is not None:
                     base_path = Path(self.user_settings.delivery_location)
 
-                for item in base_path.iterdir():
-                    if item.is_file():
-                        continue
+                # scandir reuses the directory entry type information, so
+                # this doesn't stat() every sibling like iterdir/is_file.
+                # Symlinks are followed, so linked past deliveries still
+                # count towards the latest delivery version.
+                with os.scandir(base_path) as entries:
+                    for entry in entries:
+                        if not entry.is_dir():
+                            continue
 
-                    # If iterating over non-templated folders, fake the base folder for getting the fields
-                    if self.user_settings.delivery_location is not None:
-                        item = base_template_path / item.name
+                        # If iterating over non-templated folders, fake the base folder for getting the fields
+                        if self.user_settings.delivery_location is not None:
+                            item = base_template_path / entry.name
+                        else:
+                            item = base_path / entry.name
 
-                    try:
-                        fields.append(
-                            delivery_folder_template.get_fields(str(item))
-                        )
-                    except:
-                        continue
+                        try:
+                            fields.append(
+                                delivery_folder_template.get_fields(str(item))
+                            )
+                        except TankError:
+                            # Folder doesn't match the delivery template
+                            continue
 
                 # Compile the version numbers. Filter on date if not using continuous versioning.
-                delivered_versions = [
-                    field["delivery_version"]
-                    for field in fields
-                    if self.model.settings.continuous_versioning
-                    or field["delivery_date"].date() == datetime.now().date()
-                ]
-
+                today = datetime.now().date()
+                continuous = self.model.settings.continuous_versioning
                 template_fields["delivery_version"] = (
-                    max(delivered_versions or [0]) + 1
+                    max(
+                        (
+                            field["delivery_version"]
+                            for field in fields
+                            if continuous
+                            or field["delivery_date"].date() == today
+                        ),
+                        default=0,
+                    )
+                    + 1
                 )
             else:
                 template_fields["delivery_version"] = (
                     self.user_settings.delivery_version
                 )
 
-            # Store delivery version
-            episode_delivery_versions[episode] = template_fields[
-                "delivery_version"
-            ]
+            return episode, template_fields
+
+        # The per-episode folder scans are independent and I/O bound, so
+        # run them concurrently
+        if episodes:
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(episodes))
+            ) as executor:
+                for episode, template_fields in executor.map(
+                    compute_episode_fields, episodes
+                ):
+                    # Store delivery version
+                    episode_delivery_versions[episode] = template_fields[
+                        "delivery_version"
+                    ]
 
-            csv_episode_data[episode] = {
-                "template_fields": template_fields,
-            }
+                    csv_episode_data[episode] = {
+                        "template_fields": template_fields,
+                    }
 
-        for episode in episodes if episode_folders else [None]:
+        # Resolve the episode set for folder creation and CSV generation
+        # once; the same episodes are revisited after delivery
+        csv_episodes = list(episodes) if episode_folders else [None]
+
+        for episode in csv_episodes:
             template_fields = csv_episode_data[episode]["template_fields"]
 
             # Create delivery folder
-            delivery_folder = Path(
+            delivery_folder_org = Path(
                 delivery_folder_template.apply_fields(template_fields)
             )
+            delivery_folder = delivery_folder_org
 
             # Override delivery location from user settings
             if self.user_settings.delivery_location is not None:
@@ -157,43 +241,54 @@ class ExportShotsThread(QtCore.QThread):
                 "Creating folder for delivery %s.", delivery_folder
             )
             delivery_folder.mkdir(parents=True, exist_ok=True)
+            # The folder is guaranteed to exist now; resolve its posix
+            # form once for the path rewrites in create_csv
+            delivery_folder_posix = delivery_folder.as_posix()
 
             # If delivering for episodes, use the created folder
             if episode_folders:
-                csv_episode_data[episode]["delivery_folder"] = delivery_folder
+                episode_data = csv_episode_data[episode]
+                episode_data["delivery_folder"] = delivery_folder
+                episode_data["delivery_folder_org"] = delivery_folder_org
+                episode_data["delivery_folder_posix"] = delivery_folder_posix
             else:
                 # Make sure every episode has a delivery folder
                 for ep in episodes:
-                    csv_episode_data[ep]["delivery_folder"] = delivery_folder
+                    episode_data = csv_episode_data[ep]
+                    episode_data["delivery_folder"] = delivery_folder
+                    episode_data["delivery_folder_org"] = delivery_folder_org
+                    episode_data["delivery_folder_posix"] = (
+                        delivery_folder_posix
+                    )
 
-        for entity in (
-            self.model.shots_to_deliver + self.model.assets_to_deliver
-        ):
-            for version in entity.get_versions():
-                if version.id in version_deliverables:
-                    delivery_version = episode_delivery_versions.get(None)
-                    if entity.type == EntityType.SHOT:
-                        delivery_version = episode_delivery_versions[
-                            entity.episode
-                        ]
+        for entity, version, deliverables in delivery_plan:
+            delivery_version = episode_delivery_versions.get(None)
+            if entity.type == EntityType.SHOT:
+                delivery_version = episode_delivery_versions[entity.episode]
+
+            self.model.deliver_version(
+                entity,
+                version,
+                delivery_version,
+                deliverables,
+                self.user_settings,
+                self.show_validation_error,
+                self.show_validation_message,
+                self.update_progress_bars,
+            )
 
-                    self.model.deliver_version(
-                        entity,
-                        version,
-                        delivery_version,
-                        version_deliverables[version.id],
-                        self.user_settings,
-                        self.show_validation_error,
-                        self.show_validation_message,
-                        self.update_progress_bars,
-                    )
+        for episode in csv_episodes:
+            if episode_folders:
+                items = shot_plan_by_episode.get(episode, []) + asset_plan
+            else:
+                items = delivery_plan
 
-        for episode in episodes if episode_folders else [None]:
             # Create csv
             self.create_csv(
-                (self.model.shots_to_deliver + self.model.assets_to_deliver),
-                episode,
+                items,
                 csv_episode_data[episode]["delivery_folder"],
+                csv_episode_data[episode]["delivery_folder_org"],
+                csv_episode_data[episode]["delivery_folder_posix"],
                 csv_episode_data[episode]["template_fields"],
                 episode_delivery_versions,
             )
@@ -205,366 +300,404 @@ class ExportShotsThread(QtCore.QThread):
             return ""
 
         if isinstance(field, str):
-            return re.sub(r"[^\x20-\x7E\n\r\t]+", "", field)
+            # Most values are already printable ASCII; isascii() and the
+            # set intersection both run in C, skipping the regex engine
+            if field.isascii() and not _STRIPPED_ASCII.intersection(field):
+                return field
+            return _SANITIZE_SUB("", field)
 
         try:
             return str(field)
-        except:
+        except Exception:
             return ""
 
     def create_csv(
         self,
-        validated_entities: list[Shot | Asset],
-        episode: str | None,
+        delivery_plan: list[tuple[Shot | Asset, Version, Deliverables]],
         delivery_folder: Path,
+        delivery_folder_org: Path,
+        delivery_folder_posix: str,
         template_fields: dict,
         episode_delivery_versions: dict[str | None, int],
     ):
         """
-        Create the CSV file.
+        Create the CSV file for the versions in the delivery plan.
         """
         self.model.logger.info("======== Creating CSV File ========")
-        csv_submission_form_template = self.model.app.get_template(
-            "csv_submission_form"
+
+        # The template registry lookups are invariant across the run, so
+        # resolve them once instead of per entity/version
+        get_template = self.model.app.get_template
+        csv_submission_form_template = get_template("csv_submission_form")
+        input_shot_sequence_template = get_template("input_shot_sequence")
+        delivery_shot_sequence_template = get_template(
+            "delivery_shot_sequence"
+        )
+        input_shot_preview_template = get_template("input_shot_preview")
+        delivery_shot_preview_template = get_template("delivery_shot_preview")
+        input_asset_sequence_template = get_template("input_asset_sequence")
+        delivery_asset_sequence_template = get_template(
+            "delivery_asset_sequence"
+        )
+        input_asset_preview_template = get_template("input_asset_preview")
+        delivery_asset_preview_template = get_template(
+            "delivery_asset_preview"
         )
+        input_shot_lut_template = get_template("input_shot_lut")
+        delivery_shot_lut_template = get_template("delivery_shot_lut")
+
         csv_submission_form_path: Path = Path(
             csv_submission_form_template.apply_fields(template_fields)
         )
 
-        delivery_folder_org = Path(
-            self.model.app.get_template("delivery_folder").apply_fields(
-                template_fields
-            )
-        )
+        # Precompute the posix strings once; the per-file rewrites below
+        # become a prefix check + slice instead of a full string replace
+        org_posix = delivery_folder_org.as_posix()
+        new_posix = delivery_folder_posix
+        org_len = len(org_posix)
+
+        def rewrite_posix(raw: str) -> str:
+            """Swap the templated delivery folder prefix for the actual
+            delivery folder, returning the posix string."""
+            posix = Path(raw).as_posix()
+            if posix.startswith(org_posix):
+                return new_posix + posix[org_len:]
+            return posix
 
         if self.user_settings.delivery_location is not None:
             csv_submission_form_path = Path(
-                csv_submission_form_path.as_posix().replace(
-                    delivery_folder_org.as_posix(), delivery_folder.as_posix()
-                )
+                rewrite_posix(str(csv_submission_form_path))
             )
 
+        # Constant-time status lookup for the per-version sequence output
+        seq_output_by_status = {
+            output.status: output
+            for output in self.model.settings.delivery_sequence_outputs
+        }
+
+        # The configured columns don't change during the export, so read
+        # them from the user settings once
+        csv_fields_spec = tuple(self.user_settings.csv_fields)
+        header = [key for key, _template in csv_fields_spec]
+        templates = [template for _key, template in csv_fields_spec]
+
+        self.model.logger.debug("Header: %s", header)
+
         existing_rows = []
+        existing_raw = None
         if csv_submission_form_path.is_file():
-            with open(csv_submission_form_path, "r", newline="") as file:
-                reader = csv.reader(file)
-                header = []
-                for i, row in enumerate(reader):
-                    if i == 0:
-                        header = row
-                    else:
-                        entry = {}
-                        for j in range(0, len(header)):
-                            entry[header[j]] = row[j]
+            with open(
+                csv_submission_form_path,
+                "r",
+                newline="",
+                buffering=1 << 20,
+            ) as file:
+                first_line = file.readline()
+                existing_header = next(csv.reader([first_line]), None)
+                if existing_header == header:
+                    # Unchanged header: the remaining rows can be copied
+                    # verbatim without a parse/re-serialize round trip
+                    existing_raw = file.read()
+                elif existing_header is not None:
+                    existing_rows = list(
+                        csv.DictReader(file, fieldnames=existing_header)
+                    )
 
-                        existing_rows.append(entry)
+        # A 1 MiB buffer keeps the row writes off the network filesystem
+        # until they amount to something; dialect and quoting are passed
+        # explicitly so the csv module skips autodetection
+        with open(
+            csv_submission_form_path,
+            "w",
+            newline="",
+            buffering=1 << 20,
+        ) as file:
+            writer = csv.writer(
+                file, dialect="excel", quoting=csv.QUOTE_MINIMAL
+            )
 
-        with open(csv_submission_form_path, "w", newline="") as file:
-            writer = csv.writer(file)
-            header = [key for key, template in self.user_settings.csv_fields]
+            # DictWriter re-emits the existing rows in C, dropping columns
+            # that are no longer configured and blanking new ones
+            dict_writer = csv.DictWriter(
+                file,
+                fieldnames=header,
+                extrasaction="ignore",
+                restval="",
+            )
+            dict_writer.writeheader()
+            if existing_raw:
+                file.write(existing_raw)
+                # A hand-edited file may lack the final line break; add
+                # it so the first new row doesn't join the last old one
+                if not existing_raw.endswith(("\n", "\r")):
+                    file.write("\r\n")
+            else:
+                dict_writer.writerows(existing_rows)
 
-            self.model.logger.debug("Header: %s", header)
-            writer.writerow(header)
+            shot_templates = (
+                input_shot_sequence_template,
+                delivery_shot_sequence_template,
+                input_shot_preview_template,
+                delivery_shot_preview_template,
+            )
+            asset_templates = (
+                input_asset_sequence_template,
+                delivery_asset_sequence_template,
+                input_asset_preview_template,
+                delivery_asset_preview_template,
+            )
 
-            for existing_row in existing_rows:
-                row = []
-                for item in header:
-                    if item in existing_row:
-                        row.append(existing_row[item])
-                    else:
-                        row.append("")
-                writer.writerow(row)
+            # The plan only holds versions with deliverables, so there is
+            # nothing to re-filter or re-resolve here
+            for entity, version, deliverables in delivery_plan:
+                (
+                    input_sequence_template,
+                    delivery_sequence_template,
+                    input_preview_template,
+                    delivery_preview_template,
+                ) = (
+                    shot_templates
+                    if entity.type == EntityType.SHOT
+                    else asset_templates
+                )
 
-            for entity in validated_entities:
-                if (
-                    entity.type == EntityType.SHOT
-                    and entity.episode != episode
-                    and "Episode"
-                    in self.model.app.get_template("delivery_folder").keys
-                ):
-                    continue
+                delivery_version = episode_delivery_versions.get(None)
 
                 if entity.type == EntityType.SHOT:
-                    input_sequence_template = self.model.app.get_template(
-                        "input_shot_sequence"
-                    )
-                    delivery_sequence_template = self.model.app.get_template(
-                        "delivery_shot_sequence"
-                    )
-                    input_preview_template = self.model.app.get_template(
-                        "input_shot_preview"
-                    )
-                    delivery_preview_template = self.model.app.get_template(
-                        "delivery_shot_preview"
-                    )
-                else:
-                    input_sequence_template = self.model.app.get_template(
-                        "input_asset_sequence"
-                    )
-                    delivery_sequence_template = self.model.app.get_template(
-                        "delivery_asset_sequence"
-                    )
-                    input_preview_template = self.model.app.get_template(
-                        "input_asset_preview"
-                    )
-                    delivery_preview_template = self.model.app.get_template(
-                        "delivery_asset_preview"
+                    delivery_version = episode_delivery_versions.get(
+                        entity.episode,
+                        delivery_version,
                     )
 
-                for version in entity.get_versions():
-                    deliverables = self.get_deliverables(version)
-
-                    if not (
-                        deliverables.deliver_sequence
-                        or deliverables.deliver_preview
-                    ):
-                        continue
-
-                    delivery_version = episode_delivery_versions.get(None)
-
-                    if entity.type == EntityType.SHOT:
-                        delivery_version = episode_delivery_versions.get(
+                    if delivery_version is None:
+                        self.model.logger.warning(
+                            "No delivery version found for episode %s. "
+                            "Skipping CSV row for version %s.",
                             entity.episode,
-                            delivery_version,
+                            version.id,
                         )
+                        continue
 
-                        if delivery_version is None:
-                            self.model.logger.warning(
-                                "No delivery version found for episode %s. "
-                                "Skipping CSV row for version %s.",
-                                entity.episode,
-                                version.id,
-                            )
-                            continue
-
-                    version_template_fields = {}
-                    if version.path_to_movie is not None:
-                        version_template_fields.update(
-                            input_preview_template.get_fields(
-                                version.path_to_movie
-                            )
-                        )
-                    if version.sequence_path is not None:
-                        version_template_fields.update(
-                            input_sequence_template.get_fields(
-                                version.sequence_path
-                            )
+                version_template_fields = {}
+                if version.path_to_movie is not None:
+                    version_template_fields.update(
+                        input_preview_template.get_fields(
+                            version.path_to_movie
                         )
-
+                    )
+                if version.sequence_path is not None:
                     version_template_fields.update(
-                        self.model.get_version_template_fields(
-                            entity,
-                            version,
-                            delivery_version,
+                        input_sequence_template.get_fields(
+                            version.sequence_path
                         )
                     )
 
-                    version_template_fields = compile_extra_template_fields(
-                        delivery_sequence_template,
-                        self.model.cache,
+                version_template_fields.update(
+                    self.model.get_version_template_fields(
                         entity,
                         version,
-                        version_template_fields,
+                        delivery_version,
                     )
+                )
 
-                    to_deliver = []
-                    if deliverables.deliver_sequence:
-                        sequence_path = Path(
-                            Path(
-                                delivery_sequence_template.apply_fields(
-                                    version_template_fields
-                                )
-                            )
-                            .as_posix()
-                            .replace(
-                                delivery_folder_org.as_posix(),
-                                delivery_folder.as_posix(),
-                            )
-                        )
+                version_template_fields = compile_extra_template_fields(
+                    delivery_sequence_template,
+                    self.model.cache,
+                    entity,
+                    version,
+                    version_template_fields,
+                )
 
-                        seq_codec = ""
-                        seq_bit_depth = ""
-                        output = next(
-                            (
-                                o
-                                for o in self.model.settings.delivery_sequence_outputs
-                                if o.status == version.sequence_output_status
-                            ),
-                            None,
+                # Paths stay plain posix strings until a row actually
+                # needs a Path object, avoiding two Path constructions
+                # per file
+                to_deliver = []
+                if deliverables.deliver_sequence:
+                    sequence_path = rewrite_posix(
+                        delivery_sequence_template.apply_fields(
+                            version_template_fields
                         )
-                        if output is not None:
-                            seq_codec = output.settings.get("compression", "")
-                            seq_bit_depth = (
-                                output.settings.get("datatype") or ""
-                            )
+                    )
 
-                        if (
-                            seq_codec == "" or seq_bit_depth == ""
-                        ) and version.sequence_path is not None:
-                            try:
-                                metadata = parse_exr_metadata.read_exr_header(
-                                    version.sequence_path % version.last_frame
-                                )
-                                if (
-                                    seq_codec == ""
-                                    and "compression" in metadata
-                                ):
-                                    seq_codec = EXR_COMPRESSION.get(
-                                        metadata.get("compression", ""),
-                                        "unknown",
-                                    )
-                                if seq_bit_depth == "":
-                                    channels = metadata.get("channels", {})
-                                    if len(channels) > 0:
-                                        pixel_type = next(
-                                            iter(channels.values())
-                                        )["pixel_type"]
-                                        bit_depths = {
-                                            0: "32-bit uint",
-                                            1: "16-bit half",
-                                            2: "32-bit float",
-                                        }
-                                        seq_bit_depth = bit_depths.get(
-                                            pixel_type, ""
-                                        )
-                            except Exception:
-                                pass
+                    seq_codec = ""
+                    seq_bit_depth = ""
+                    output = seq_output_by_status.get(
+                        version.sequence_output_status
+                    )
+                    if output is not None:
+                        seq_codec = output.settings.get("compression", "")
+                        seq_bit_depth = (
+                            output.settings.get("datatype") or ""
+                        )
 
-                        to_deliver.append(
-                            (
-                                sequence_path,
-                                seq_codec,
-                                seq_bit_depth,
-                                self.model.settings.add_slate_to_sequence,
+                    if (
+                        seq_codec == "" or seq_bit_depth == ""
+                    ) and version.sequence_path is not None:
+                        try:
+                            metadata = _exr_header(
+                                version.sequence_path % version.last_frame
                             )
-                        )
-                    if deliverables.deliver_preview:
-                        for (
-                            output
-                        ) in self.user_settings.delivery_preview_outputs:
-                            output_template_fields = {
-                                **version_template_fields,
-                                "delivery_preview_extension": output.extension,
-                            }
-                            preview_path = Path(
-                                Path(
-                                    delivery_preview_template.apply_fields(
-                                        output_template_fields
-                                    )
-                                )
-                                .as_posix()
-                                .replace(
-                                    delivery_folder_org.as_posix(),
-                                    delivery_folder.as_posix(),
+                            if (
+                                seq_codec == ""
+                                and "compression" in metadata
+                            ):
+                                seq_codec = EXR_COMPRESSION.get(
+                                    metadata.get("compression", ""),
+                                    "unknown",
                                 )
-                            )
-
-                            bit_depth = ""
-                            for value in output.settings.values():
-                                if isinstance(value, str):
-                                    match = re.search(
-                                        r"(\d+)[ ]*-?bit",
-                                        value,
-                                        re.IGNORECASE,
+                            if seq_bit_depth == "":
+                                channels = metadata.get("channels", {})
+                                if len(channels) > 0:
+                                    pixel_type = next(
+                                        iter(channels.values())
+                                    )["pixel_type"]
+                                    bit_depths = {
+                                        0: "32-bit uint",
+                                        1: "16-bit half",
+                                        2: "32-bit float",
+                                    }
+                                    seq_bit_depth = bit_depths.get(
+                                        pixel_type, ""
                                     )
-                                    if match:
-                                        bit_depth = match.group(1) + "-bit"
-                                        break
-
-                            to_deliver.append(
-                                (
-                                    preview_path,
-                                    output.name,
-                                    bit_depth,
-                                    True,
-                                )
-                            )
-
-                    if (
-                        entity.type == EntityType.SHOT
-                        and (
-                            deliverables.deliver_sequence
-                            or deliverables.deliver_preview
+                        except Exception:
+                            pass
+
+                    to_deliver.append(
+                        (
+                            sequence_path,
+                            seq_codec,
+                            seq_bit_depth,
+                            self.model.settings.add_slate_to_sequence,
                         )
-                        and self.model.app.get_template("input_shot_lut")
-                        is not None
-                        and self.model.app.get_template("delivery_shot_lut")
-                        is not None
-                    ):
-                        delivery_lut = Path(
-                            Path(
-                                self.model.app.get_template(
-                                    "delivery_shot_lut"
-                                ).apply_fields(version_template_fields)
-                            )
-                            .as_posix()
-                            .replace(
-                                delivery_folder_org.as_posix(),
-                                delivery_folder.as_posix(),
+                    )
+                if deliverables.deliver_preview:
+                    # The outputs only differ in their extension, so copy
+                    # the fields once and overwrite that single key
+                    output_template_fields = dict(version_template_fields)
+                    for (
+                        output
+                    ) in self.user_settings.delivery_preview_outputs:
+                        output_template_fields[
+                            "delivery_preview_extension"
+                        ] = output.extension
+                        preview_path = rewrite_posix(
+                            delivery_preview_template.apply_fields(
+                                output_template_fields
                             )
                         )
 
+                        bit_depth = output.get_bit_depth()
+
                         to_deliver.append(
                             (
-                                delivery_lut,
-                                "",
-                                "",
-                                False,
+                                preview_path,
+                                output.name,
+                                bit_depth,
+                                True,
                             )
                         )
 
-                    for file_path, codec, bit_depth, has_slate in to_deliver:
-                        file_name = file_path.name
+                if (
+                    entity.type == EntityType.SHOT
+                    and (
+                        deliverables.deliver_sequence
+                        or deliverables.deliver_preview
+                    )
+                    and input_shot_lut_template is not None
+                    and delivery_shot_lut_template is not None
+                ):
+                    delivery_lut = rewrite_posix(
+                        delivery_shot_lut_template.apply_fields(
+                            version_template_fields
+                        )
+                    )
+
+                    to_deliver.append(
+                        (
+                            delivery_lut,
+                            "",
+                            "",
+                            False,
+                        )
+                    )
+
+                def version_rows(
+                    entity=entity, version=version, to_deliver=to_deliver
+                ):
+                    """Yield one sanitized row per deliverable file."""
+                    debug = self.model.logger.isEnabledFor(logging.DEBUG)
+                    format_field = self.format_field
+                    for (
+                        file_posix,
+                        codec,
+                        bit_depth,
+                        has_slate,
+                    ) in to_deliver:
+                        file_name = file_posix.rsplit("/", 1)[-1]
 
                         csv_fields = []
 
-                        if not file_path.exists():
-                            error_msg = f'The file(s) of the delivered version "{version.code}" could not be found! Skipping row in CSV. {file_path.as_posix()}'
+                        if not _exists_cached(file_posix):
+                            error_msg = f'The file(s) of the delivered version "{version.code}" could not be found! Skipping row in CSV. {file_posix}'
                             try:
-                                first_frame_path = file_path.with_name(
-                                    file_name % version.last_frame
-                                )
-                                if not first_frame_path.exists():
+                                first_frame_posix = file_posix[
+                                    : len(file_posix) - len(file_name)
+                                ] + (file_name % version.last_frame)
+                                if not _exists_cached(first_frame_posix):
                                     self.model.logger.error(error_msg)
                                     continue
-                            except:
+                            except (TypeError, ValueError):
+                                # File name has no frame placeholder
                                 self.model.logger.error(error_msg)
                                 continue
 
-                        for _key, template in self.user_settings.csv_fields:
-                            context = Context(
-                                shot=entity,
-                                version=version,
-                                file=FileContext(
-                                    file_path=file_path,
-                                    directory_path=delivery_folder,
-                                    codec=codec,
-                                    bit_depth=bit_depth,
-                                    has_slate=has_slate,
-                                ),
-                                cache=self.model.cache,
+                        # The context only depends on the file, so
+                        # build it once per row instead of per column
+                        context = Context(
+                            shot=entity,
+                            version=version,
+                            file=FileContext(
+                                file_path=Path(file_posix),
+                                directory_path=delivery_folder,
+                                codec=codec,
+                                bit_depth=bit_depth,
+                                has_slate=has_slate,
+                            ),
+                            cache=self.model.cache,
+                        )
+
+                        if debug:
+                            self.model.logger.debug(
+                                "Shot %s, Version %s, File %s",
+                                entity.id,
+                                version.id,
+                                file_name,
                             )
+
+                        # Sanitize each value as it is resolved, instead
+                        # of rebuilding the row in a second pass
+                        for template in templates:
                             try:
-                                self.model.logger.debug(
-                                    "Shot %s, Version %s, File %s",
-                                    entity.id,
-                                    version.id,
-                                    file_path.name,
-                                )
                                 csv_fields.append(
-                                    template.apply_context(context)
+                                    format_field(
+                                        template.apply_context(context)
+                                    )
                                 )
                             except Exception as err:
                                 self.model.logger.error(err)
                                 csv_fields.append("")
 
-                        # Sanitize text
-                        csv_fields = [
-                            self.format_field(field) for field in csv_fields
-                        ]
+                        # zip allocates a tuple per column, so only
+                        # build it when debug logging is on
+                        if debug:
+                            self.model.logger.debug(
+                                "Writing row: %s",
+                                list(zip(header, csv_fields)),
+                            )
 
-                        self.model.logger.debug("Writing row:")
-                        self.model.logger.debug(list(zip(header, csv_fields)))
+                        yield csv_fields
 
-                        writer.writerow(csv_fields)
+                # One C-level writerows call per version instead of a
+                # Python writerow dispatch per file
+                writer.writerows(version_rows())
         self.model.logger.info("=" * 35)
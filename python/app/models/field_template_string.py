@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import re
+import struct
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import sgtk
@@ -16,11 +18,49 @@ if TYPE_CHECKING:
 
 logger = sgtk.platform.get_logger(__name__)
 
+# Shared cache-less instances keyed by template string, so re-parsing
+# configuration (e.g. version overrides) doesn't recompile templates
+_INSTANCE_CACHE: dict[str, FieldTemplateString] = {}
+
+# Compiled once at import; field extraction and the frame-spec rewrite
+# run per template resolution
+_FIELD_RE = re.compile(r"<([\w.%]+)>")
+_FRAME_SPEC_RE = re.compile(r"(%0(\d)d)")
+
+# Allowed entities and file fields used by validate; frozen so every
+# validation shares the same set objects
+_ALLOWED_ENTITIES_DEFAULT = frozenset(
+    ("file", "project", "shot", "version", "date")
+)
+_FILE_FIELDS = frozenset(
+    ("name", "name_ranged", "codec", "compression", "bit_depth", "folder")
+)
+_SG_ENTITIES = frozenset(("project", "shot", "version"))
+
+
+@lru_cache(maxsize=256)
+def _read_exr_header_cached(path: str) -> dict:
+    """
+    Cached EXR header read; templates that resolve both compression and
+    bit depth for the same frame file parse its header once.
+    """
+    return parse_exr_metadata.read_exr_header(path)
+
 
 class FieldTemplateString:
+    __slots__ = (
+        "template",
+        "_repr_template",
+        "fields",
+        "ordered_fields",
+        "cache",
+        "_ordered_items",
+        "_parts",
+    )
+
     template: str
-    fields = list[str]
-    ordered_fields = dict[str, str]
+    fields: list[str]
+    ordered_fields: dict[str, list[str]]
     cache: ShotGridCache | None
 
     def __init__(self, template: str, cache: ShotGridCache | None = None):
@@ -29,9 +69,15 @@ class FieldTemplateString:
             ">", "＞"
         )
 
-        self.fields = self._extract_fields()
+        # The literal/token parts of the template; apply_context fills
+        # the token slots instead of rescanning the template per call
+        self._parts = _FIELD_RE.split(self.template)
+
+        self.fields, self.ordered_fields = self._parse_template()
 
-        self.ordered_fields = self._order_fields()
+        # Precomputed (entity, fields) pairs, so apply_context doesn't
+        # rebuild the items view per call
+        self._ordered_items = tuple(self.ordered_fields.items())
 
         self.cache = cache
 
@@ -39,6 +85,18 @@ class FieldTemplateString:
             msg = 'Validation of field template string "%s" failed.'
             raise Exception(msg, template)
 
+    @classmethod
+    def get(cls, template: str) -> FieldTemplateString:
+        """
+        Get a shared FieldTemplateString for a template string, compiling
+        it only on first use. Only for instances without a ShotGrid cache.
+        """
+        instance = _INSTANCE_CACHE.get(template)
+        if instance is None:
+            instance = cls(template)
+            _INSTANCE_CACHE[template] = instance
+        return instance
+
     def validate(self, allowed_entities: list[str] | None = None):
         success = True
 
@@ -46,13 +104,7 @@ class FieldTemplateString:
             return True
 
         if allowed_entities is None:
-            allowed_entities = [
-                "file",
-                "project",
-                "shot",
-                "version",
-                "date",
-            ]
+            allowed_entities = _ALLOWED_ENTITIES_DEFAULT
 
         logger.debug(
             'Validating template "%s":',
@@ -60,6 +112,9 @@ class FieldTemplateString:
         )
         logger.debug("  Fields: %s", ", ".join(self.fields))
 
+        # Allowed field sets per SG entity, built once per validation
+        entity_allowed: dict[str, frozenset[str]] = {}
+
         for field in self.fields:
             if "." in field:
                 entry = field.split(".")
@@ -69,14 +124,7 @@ class FieldTemplateString:
 
                 if entity in allowed_entities:
                     if entity == "file":
-                        if field_name not in [
-                            "name",
-                            "name_ranged",
-                            "codec",
-                            "compression",
-                            "bit_depth",
-                            "folder",
-                        ]:
+                        if field_name not in _FILE_FIELDS:
                             logger.debug(
                                 '  Field "%s" is not available for a file entity.',
                                 entity,
@@ -84,19 +132,17 @@ class FieldTemplateString:
                             success = False
                         continue
 
-                    if entity in [
-                        "project",
-                        "shot",
-                        "version",
-                    ]:
+                    if entity in _SG_ENTITIES:
                         if self.cache is not None:
                             entity_name = entity[0].upper() + entity[1:]
+                            allowed_fields = entity_allowed.get(entity_name)
+                            if allowed_fields is None:
+                                allowed_fields = frozenset(
+                                    self.cache.fields.get(entity_name, ())
+                                ) | {"code", "description"}
+                                entity_allowed[entity_name] = allowed_fields
                             field_base = field_name.split(".")[0]
-                            if field_base not in [
-                                *self.cache.fields.get(entity_name, []),
-                                "code",
-                                "description",
-                            ]:
+                            if field_base not in allowed_fields:
                                 logger.debug(
                                     '  Field "%s" could not be found in "%s".',
                                     field_name,
@@ -128,45 +174,26 @@ class FieldTemplateString:
             msg = f'No file context supplied for resolving field template string "{self.template}".'
             raise Exception(msg)
 
-        project = next(
-            project
-            for project in context.cache.get_raw("Project")
-            if project["id"] == context.cache.context.project["id"]
-        )
+        # The by-id indexes turn every entity resolution below into a
+        # dict lookup instead of a linear scan over the cache
+        project = context.cache.get_raw_by_id("Project")[
+            context.cache.context.project["id"]
+        ]
+        version_index = context.cache.get_raw_by_id("Version")
+        shot_index = context.cache.get_raw_by_id("Shot")
         version = None
         shot = None
 
         if context.entity is not None:
             if context.entity.get("type") == "Version":
                 logger.debug("Got version from provided entity.")
-                version = next(
-                    (
-                        version
-                        for version in context.cache.get_raw("Version")
-                        if version["id"] == context.entity["id"]
-                    ),
-                    None,
-                )
+                version = version_index.get(context.entity["id"])
             if context.entity.get("type") == "Shot":
                 logger.debug("Got shot from provided entity.")
-                shot = next(
-                    (
-                        shot
-                        for shot in context.cache.get_raw("Shot")
-                        if shot["id"] == context.entity["id"]
-                    ),
-                    None,
-                )
+                shot = shot_index.get(context.entity["id"])
 
         if version is None and context.version is not None:
-            version = next(
-                (
-                    v
-                    for v in context.cache.get_raw("Version")
-                    if v["id"] == context.version.id
-                ),
-                None,
-            )
+            version = version_index.get(context.version.id)
             if version is None:
                 logger.debug(
                     "Couldn't resolve version from provided version: %s",
@@ -181,14 +208,7 @@ class FieldTemplateString:
             raise Exception(msg)
 
         if version is not None and version["entity"]["type"] == "Shot":
-            shot = next(
-                (
-                    s
-                    for s in context.cache.get_raw("Shot")
-                    if s["id"] == version["entity"]["id"]
-                ),
-                None,
-            )
+            shot = shot_index.get(version["entity"]["id"])
             if shot is None:
                 logger.debug(
                     "Couldn't resolve shot from resolved version: %s",
@@ -197,15 +217,8 @@ class FieldTemplateString:
             else:
                 logger.debug("Got shot from resolved version.")
         if shot is None and context.shot is not None:
-            shot = next(
-                (
-                    s
-                    for s in context.cache.get_raw("shot")
-                    if s["id"] == context.shot.id
-                ),
-                None,
-            )
-            if version is None:
+            shot = shot_index.get(context.shot.id)
+            if shot is None:
                 logger.debug(
                     "Couldn't resolve shot from provided shot: %s",
                     context.shot,
@@ -220,55 +233,104 @@ class FieldTemplateString:
 
         # Fix footage format links
         if shot is not None:
-            large_map = {
-                ff["id"]: ff
-                for ff in context.cache.get(
-                    context.cache.settings.footage_format_entity
-                )
-            }
-            shot[context.cache.settings.shot_footage_formats_field] = [
-                large_map[i["id"]]
-                for i in shot[
-                    context.cache.settings.shot_footage_formats_field
+            large_map = context.cache.get_by_id(
+                context.cache.settings.footage_format_entity
+            )
+            formats_field = (
+                context.cache.settings.shot_footage_formats_field
+            )
+            shot_formats = shot[formats_field]
+            # Skip the rewrite when a previous resolution already
+            # replaced the links with the cached entities
+            if any(
+                large_map.get(link["id"]) is not link
+                for link in shot_formats
+            ):
+                shot[formats_field] = [
+                    large_map[link["id"]]
+                    for link in shot_formats
+                    if link["id"] in large_map
                 ]
-                if i["id"] in large_map
-            ]
 
         sg_data = {
             "project": project,
             "shot": shot,
             "version": version,
         }
-        template = self.template
+        # Resolved values are collected here and substituted in a single
+        # pass at the end, instead of one str.replace scan per field
+        resolved: dict[str, str] = {}
+
+        # Compression and bit depth both derive from the last-frame EXR
+        # header; parse it lazily and only once per resolution
+        exr_fields: dict[str, str] | None = None
+
+        def resolve_exr_fields() -> dict[str, str]:
+            nonlocal exr_fields
+            if exr_fields is None:
+                exr_fields = {"compression": "", "bit_depth": ""}
+                try:
+                    metadata = _read_exr_header_cached(
+                        context.file.file_path.as_posix()
+                        % context.version.last_frame
+                    )
+                # struct.error is what the header parser raises on a
+                # truncated or partially written EXR
+                except (
+                    OSError,
+                    TypeError,
+                    ValueError,
+                    KeyError,
+                    struct.error,
+                ) as err:
+                    logger.debug("EXR header read failed: %s", err)
+                    return exr_fields
+                if "compression" in metadata:
+                    exr_fields["compression"] = EXR_COMPRESSION.get(
+                        metadata["compression"],
+                        "unknown",
+                    )
+                channels = metadata.get("channels", {})
+                if len(channels) > 0:
+                    pixel_type = next(iter(channels.values()))["pixel_type"]
+                    bit_depths = {
+                        0: "32-bit uint",
+                        1: "16-bit half",
+                        2: "32-bit float",
+                    }
+                    exr_fields["bit_depth"] = bit_depths.get(pixel_type, "")
+            return exr_fields
+
+        # One timestamp per resolution, so every <date.*> field in the
+        # template formats the same instant
+        now = datetime.now() if "date" in self.ordered_fields else None
+
+        for entity, fields in self._ordered_items:
+            is_file_entity = entity == "file"
+            if is_file_entity:
+                # The path parts are invariant for the whole field loop
+                file_name = context.file.file_path.name
+                folder_name = context.file.directory_path.name
+                is_exr = file_name.lower().endswith(".exr")
 
-        for entity, fields in self.ordered_fields.items():
             for field in fields:
                 logger.debug("%s: %s", entity, field)
                 field_value = None
-                if entity == "file":
-                    file_name = context.file.file_path.name
-                    output_file_path = context.file.file_path.as_posix()
+                if is_file_entity:
                     if field == "name":
                         field_value = file_name
                     elif field == "name_ranged":
-                        new_file_name = file_name
-
-                        # Extract frame pattern and replace with frame range
-                        frame_pattern = re.compile(r"(%0(\d)d)")
-                        frame_match = re.search(frame_pattern, new_file_name)
-                        if frame_match:
-                            full_frame_spec = frame_match.group(1)
-
-                            first_frame = context.version.first_frame
-                            if context.file.has_slate:
-                                first_frame -= 1
-
-                            new_file_name = new_file_name.replace(
-                                full_frame_spec,
-                                f"[{first_frame}-{context.version.last_frame}]",
-                            )
-
-                        field_value = new_file_name
+                        first_frame = context.version.first_frame
+                        if context.file.has_slate:
+                            first_frame -= 1
+
+                        # Swap the frame spec for the frame range in one
+                        # pass; without a match the name passes through
+                        field_value = _FRAME_SPEC_RE.sub(
+                            f"[{first_frame}-{context.version.last_frame}]",
+                            file_name,
+                            count=1,
+                        )
 
                     if field in ("codec", "compression"):
                         if (
@@ -277,54 +339,20 @@ class FieldTemplateString:
                         ):
                             field_value = context.file.codec
 
-                        elif file_name.endswith(".exr"):
-                            try:
-                                metadata = parse_exr_metadata.read_exr_header(
-                                    output_file_path
-                                    % context.version.last_frame
-                                )
-                                if "compression" in metadata:
-                                    field_value = EXR_COMPRESSION.get(
-                                        metadata["compression"],
-                                        "unknown",
-                                    )
-                                else:
-                                    field_value = ""
-                            except:
-                                field_value = ""
+                        elif is_exr:
+                            field_value = resolve_exr_fields()["compression"]
                     elif field == "bit_depth":
                         if (
                             context.file.bit_depth is not None
                             and context.file.bit_depth != ""
                         ):
                             field_value = context.file.bit_depth
-                        elif file_name.endswith(".exr"):
-                            try:
-                                metadata = parse_exr_metadata.read_exr_header(
-                                    output_file_path
-                                    % context.version.last_frame
-                                )
-                                channels = metadata.get("channels", {})
-                                if len(channels) > 0:
-                                    pixel_type = next(iter(channels.values()))[
-                                        "pixel_type"
-                                    ]
-                                    bit_depths = {
-                                        0: "32-bit uint",
-                                        1: "16-bit half",
-                                        2: "32-bit float",
-                                    }
-                                    field_value = bit_depths.get(
-                                        pixel_type, ""
-                                    )
-                                else:
-                                    field_value = ""
-                            except:
-                                field_value = ""
+                        elif is_exr:
+                            field_value = resolve_exr_fields()["bit_depth"]
                         else:
                             field_value = ""
                     if field == "folder":
-                        field_value = context.file.directory_path.name
+                        field_value = folder_name
 
                 elif entity == "version" and field == (
                     context.cache.settings.attachment_field
@@ -339,10 +367,9 @@ class FieldTemplateString:
                         field_value = ""
 
                 elif entity == "date":
-                    date = datetime.now()
                     # Try to format the date
                     try:
-                        field_value = date.strftime(field)
+                        field_value = now.strftime(field)
                     except Exception as err:
                         msg = f'Failed to convert date to format "{entity}.{field}".'
                         raise Exception(msg) from err
@@ -372,32 +399,38 @@ class FieldTemplateString:
                         field_value = None
 
                 if field_value is not None:
-                    template = template.replace(
-                        f"<{entity}.{field}>", str(field_value)
-                    )
+                    resolved[f"{entity}.{field}"] = str(field_value)
                 else:
                     msg = (
                         f'Failed to resolve template field: "{entity}.{field}"'
                     )
                     raise Exception(msg)
 
-        return template
+        # The odd entries of the precomputed split are the field tokens;
+        # fill them in and join, without rescanning the template
+        parts = self._parts[:]
+        for i in range(1, len(parts), 2):
+            parts[i] = resolved[parts[i]]
+        return "".join(parts)
 
-    def _extract_fields(self):
+    def _parse_template(self) -> tuple[list[str], dict[str, list[str]]]:
         """
-        Extract all fields wrapped in <…> where a field may contain
-        letters, digits, underscores and dots.
+        Collect the fields wrapped in <…> and group them per entity in
+        one pass over the split template parts. Repeated fields are kept
+        once, in first-seen order, so they only resolve once.
         """
-        return re.findall(r"<([\w.%]+)>", self.template)
+        fields: list[str] = []
+        ordered_fields: dict[str, list[str]] = {}
+        seen = set()
 
-    def _order_fields(self):
-        ordered_fields = {}
+        # The odd entries of the split are the field tokens
+        for token in self._parts[1::2]:
+            if token in seen:
+                continue
+            seen.add(token)
+            fields.append(token)
 
-        for field in self.fields:
-            entry = field.split(".")
-            if entry[0] in ordered_fields:
-                ordered_fields[entry[0]].append(".".join(entry[1:]))
-            else:
-                ordered_fields[entry[0]] = [".".join(entry[1:])]
+            entity, _, field_name = token.partition(".")
+            ordered_fields.setdefault(entity, []).append(field_name)
 
-        return ordered_fields
+        return fields, ordered_fields
@@ -9,20 +9,28 @@ from sgtk.platform.qt5 import QtCore
 #     pass
 
 
-class LoadShotsThread(QtCore.QThread):
-    """Class for loading shots on a separate thread
-    so the UI doesn't freeze."""
+class LoadShotsSignals(QtCore.QObject):
+    """Signals emitted by a LoadShotsRunnable."""
 
     loading_shots_successful = QtCore.Signal(object)
     loading_shots_failed = QtCore.Signal(object)
 
+
+class LoadShotsRunnable(QtCore.QRunnable):
+    """Class for loading shots on the shared thread pool
+    so the UI doesn't freeze and repeated reloads reuse warm workers."""
+
     def __init__(self, model):
         super().__init__()
         self.model = model
+        self.signals = LoadShotsSignals()
+        # The model keeps a reference to the runnable, so the pool must
+        # not delete it after run
+        self.setAutoDelete(False)
 
     def run(self):
         try:
             shots_to_deliver = self.model.get_versions_to_deliver()
-            self.loading_shots_successful.emit(shots_to_deliver)
+            self.signals.loading_shots_successful.emit(shots_to_deliver)
         except Exception:
-            self.loading_shots_failed.emit(traceback.format_exc())
+            self.signals.loading_shots_failed.emit(traceback.format_exc())
@@ -4,7 +4,7 @@ import re
 from typing import TYPE_CHECKING, Callable
 
 import sgtk
-from sgtk.platform.qt5 import QtCore, QtWidgets
+from sgtk.platform.qt5 import QtCore
 
 from .errors import LicenseError
 
@@ -13,17 +13,19 @@ if TYPE_CHECKING:
 
 # # For development only
 # try:
-#     from PySide6 import QtCore, QtWidgets
+#     from PySide6 import QtCore
 # except ImportError:
 #     pass
 
 logger = sgtk.platform.get_logger(__name__)
 
+# Compiled once at import; matched against every chunk of Nuke stdout
+_PROGRESS_RE = re.compile(r".*Frame ([0-9]+) \(([0-9]+) of ([0-9]+)\)")
+
 
 class NukeProcess:
     _has_started: bool = False
     _has_rendered: bool = False
-    _error_message: str = ""
     _error: Exception | None = None
 
     def __init__(
@@ -42,11 +44,24 @@ class NukeProcess:
         self.show_validation_message = show_validation_message
         self.update_progress_bars = update_progress_bars
         self.on_error = on_error
+        # Stderr arrives in many small chunks; collecting them in a list
+        # and joining once avoids quadratic string concatenation
+        self._error_chunks: list[str] = []
 
         self.process.readyReadStandardOutput.connect(self._on_output)
         self.process.readyReadStandardError.connect(self._on_script_error)
 
         self.name = name
+        # Precomputed so the readyRead handlers don't rebuild f-strings
+        # on every chunk of Nuke output
+        self._starting_msg = (
+            f"Starting {name} render..."
+            if name is not None
+            else "Starting render..."
+        )
+        self._rendering_msg = (
+            f"Rendering {name}..." if name is not None else "Rendering..."
+        )
 
         if ocio_path is not None:
             env = QtCore.QProcessEnvironment.systemEnvironment()
@@ -55,18 +70,18 @@ class NukeProcess:
 
     def _on_output(self):
         """Handle logs"""
-        data = self.process.readAllStandardOutput().data()
-        stdout = bytes(data).decode("utf8").strip()
+        # QByteArray converts to bytes directly; the .data() round trip
+        # copied every chunk twice
+        stdout = (
+            bytes(self.process.readAllStandardOutput())
+            .decode("utf-8", errors="replace")
+            .strip()
+        )
         if stdout != "":
             logger.debug(stdout)
 
         if not self._has_started:
-            if self.name is not None:
-                self.version.validation_message = (
-                    f"Starting {self.name} render..."
-                )
-            else:
-                self.version.validation_message = "Starting render..."
+            self.version.validation_message = self._starting_msg
             self.show_validation_message(self.version)
             self.update_progress_bars(0)
             self._has_started = True
@@ -78,18 +93,10 @@ class NukeProcess:
                 self.on_error(LicenseError(stdout))
             raise LicenseError(stdout)
 
-        progress = re.search(
-            r".*Frame ([0-9]+) \(([0-9]+) of ([0-9]+)\)",
-            stdout,
-        )
+        progress = _PROGRESS_RE.search(stdout)
         if progress:
             if not self._has_rendered:
-                if self.name is not None:
-                    self.version.validation_message = (
-                        f"Rendering {self.name}..."
-                    )
-                else:
-                    self.version.validation_message = "Rendering..."
+                self.version.validation_message = self._rendering_msg
                 self.show_validation_message(self.version)
                 self._has_rendered = True
 
@@ -99,9 +106,15 @@ class NukeProcess:
 
     def _on_script_error(self):
         """Handle errors"""
-        data = self.process.readAllStandardError().data()
-        stderr = bytes(data).decode("utf8")
-        self._error_message += stderr
+        stderr = bytes(self.process.readAllStandardError()).decode(
+            "utf-8", errors="replace"
+        )
+        self._error_chunks.append(stderr)
+
+    @property
+    def _error_message(self) -> str:
+        """The collected stderr of the render process."""
+        return "".join(self._error_chunks)
 
     def run(self, nuke_path: str, args: list[str]):
         """
@@ -114,13 +127,22 @@ class NukeProcess:
         self.process.start(nuke_path, args)
         self.process.waitForStarted()
 
-        # Process application events while waiting for it to finish
-        while self.process.state() == QtCore.QProcess.Running:
-            QtWidgets.QApplication.processEvents()
-
-        if self._error_message != "":
+        # Wait event-driven instead of spinning on processEvents; the
+        # readyRead handlers keep firing inside the local event loop
+        if self.process.state() == QtCore.QProcess.Running:
+            loop = QtCore.QEventLoop()
+            self.process.finished.connect(loop.quit)
+            self.process.errorOccurred.connect(loop.quit)
+            try:
+                loop.exec_()
+            finally:
+                self.process.finished.disconnect(loop.quit)
+                self.process.errorOccurred.disconnect(loop.quit)
+
+        error_message = self._error_message
+        if error_message != "":
             if (
-                "AddTimeCode: Invalid start time code" in self._error_message
+                "AddTimeCode: Invalid start time code" in error_message
                 and "--timecode-ref" in args
             ):
                 new_args = args
@@ -133,12 +155,12 @@ class NukeProcess:
                 self.reset()
                 self.run(nuke_path, new_args)
                 return
-            raise Exception(self._error_message)
+            raise Exception(error_message)
 
     def reset(self):
         """Reset the NukeProcess to restart a render."""
         self._has_started = False
         self._has_rendered = False
         self.update_progress_bars(0)
-        self._error_message = ""
+        self._error_chunks = []
         self._error = None
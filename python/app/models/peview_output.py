@@ -1,11 +1,27 @@
 import json
+import re
+
+# Compiled once at import; scanned over the output settings on the first
+# bit-depth request
+_BIT_DEPTH_RE = re.compile(r"(\d+)[ ]*-?bit", re.IGNORECASE)
 
 
 class PreviewOutput:
+    __slots__ = (
+        "name",
+        "extension",
+        "default_enabled",
+        "settings",
+        "use_letterbox",
+        "_cli_string_cache",
+        "_bit_depth_cache",
+    )
+
     name: str
     extension: str
     default_enabled: bool
     settings: dict
+    use_letterbox: bool
 
     def __init__(
         self,
@@ -20,9 +36,36 @@ class PreviewOutput:
         self.default_enabled = default_enabled
         self.settings = settings
         self.use_letterbox = use_letterbox
+        self._cli_string_cache = None
+        self._bit_depth_cache = None
 
     def to_cli_string(self):
-        return json.dumps({**self.settings, "file_type": self.extension})
+        # PreviewOutput is immutable after construction, so the encoded
+        # JSON can be reused. Compact separators keep the CLI line short.
+        if self._cli_string_cache is None:
+            self._cli_string_cache = json.dumps(
+                {**self.settings, "file_type": self.extension},
+                separators=(",", ":"),
+            )
+        return self._cli_string_cache
+
+    def get_bit_depth(self) -> str:
+        """
+        Get the bit depth named in the output settings, e.g. "10-bit".
+
+        The settings are immutable after construction, so the scan runs
+        once and the result is cached on the instance.
+        """
+        if self._bit_depth_cache is None:
+            bit_depth = ""
+            for value in self.settings.values():
+                if isinstance(value, str):
+                    match = _BIT_DEPTH_RE.search(value)
+                    if match:
+                        bit_depth = match.group(1) + "-bit"
+                        break
+            self._bit_depth_cache = bit_depth
+        return self._bit_depth_cache
 
     @staticmethod
     def from_dict(data: dict):
@@ -35,15 +78,20 @@ class PreviewOutput:
         )
 
     def __eq__(self, other):
+        if self is other:
+            return True
+
         if not isinstance(other, PreviewOutput):
             return NotImplemented
 
+        # Cheap scalar comparisons first so the settings dict walk only
+        # happens when everything else already matches.
         return (
-            self.name == other.name
-            and self.extension == other.extension
+            self.extension == other.extension
+            and self.name == other.name
             and self.default_enabled == other.default_enabled
-            and self.settings == other.settings
             and self.use_letterbox == other.use_letterbox
+            and self.settings == other.settings
         )
 
     def __str__(self):
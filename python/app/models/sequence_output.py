@@ -2,6 +2,14 @@ import json
 
 
 class SequenceOutput:
+    __slots__ = (
+        "name",
+        "extension",
+        "status",
+        "settings",
+        "_cli_string_cache",
+    )
+
     name: str
     extension: str
     status: str
@@ -12,9 +20,17 @@ class SequenceOutput:
         self.extension = extension
         self.status = status
         self.settings = settings
+        self._cli_string_cache = None
 
     def to_cli_string(self):
-        return json.dumps({**self.settings, "file_type": self.extension})
+        # SequenceOutput is immutable after construction, so the encoded
+        # JSON can be reused. Compact separators keep the CLI line short.
+        if self._cli_string_cache is None:
+            self._cli_string_cache = json.dumps(
+                {**self.settings, "file_type": self.extension},
+                separators=(",", ":"),
+            )
+        return self._cli_string_cache
 
     @staticmethod
     def from_dict(data: dict):
@@ -27,9 +43,14 @@ class SequenceOutput:
         )
 
     def __eq__(self, other):
+        if self is other:
+            return True
+
         if not isinstance(other, SequenceOutput):
             return NotImplemented
 
+        # Cheap scalar comparisons first so the settings dict walk only
+        # happens when everything else already matches.
         return (
             self.name == other.name
             and self.extension == other.extension
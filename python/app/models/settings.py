@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import weakref
 from typing import TYPE_CHECKING
 
 from tank.template import TemplateString
@@ -8,18 +9,78 @@ from tank.templatekey import IntegerKey, StringKey
 from . import PreviewOutput, SequenceOutput
 from .field_template_string import FieldTemplateString
 from .user_settings import UserSettings
+from .util import get_schema
 from .version_override import VersionOverride
 
 if TYPE_CHECKING:
     from .context import Context
 
+# Per sgtk instance: the merged template keys and the TemplateStrings
+# compiled with them. The slate extra fields come from configuration, so
+# recompiling them for every Settings instance just redoes the same
+# template parsing. Weakly keyed, so an engine reload that replaces the
+# instance drops both instead of serving stale entries.
+_MERGED_KEYS_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_template_string(
+    value: str, key: str, keys: dict, cache: dict
+) -> TemplateString:
+    """
+    Get a compiled TemplateString from the per-sgtk-instance cache,
+    compiling and caching it on first use.
+    """
+    cache_key = (value, key)
+    template = cache.get(cache_key)
+    if template is None:
+        template = TemplateString(value, keys, key)
+        cache[cache_key] = template
+    return template
+
 
 class Settings:
     """
     App configuration
     """
 
-    user_settings: UserSettings = UserSettings()
+    __slots__ = (
+        "_app",
+        "user_settings",
+        "delivery_preview_outputs",
+        "delivery_sequence_outputs",
+        "version_overrides",
+        "default_csv",
+        "shot_status_field",
+        "version_status_field",
+        "show_name_field",
+        "vfx_scope_of_work_field",
+        "submitting_for_field",
+        "submission_note_field",
+        "short_submission_note_field",
+        "attachment_field",
+        "delivery_sequence_outputs_field",
+        "shot_delivery_status",
+        "version_delivery_status",
+        "version_delivered_status",
+        "version_preview_delivered_status",
+        "shot_delivered_status",
+        "preview_colorspace_idt",
+        "preview_colorspace_odt",
+        "sequence_colorspace",
+        "add_slate_to_sequence",
+        "override_preview_submission_note",
+        "continuous_versioning",
+        "remove_alpha_from_sequence",
+        "slate_extra_fields",
+        "footage_format_fields",
+        "footage_format_entity",
+        "shot_footage_formats_field",
+        "asset_footage_formats_field",
+        "_overrides_by_type",
+        "_extra_fields_cache",
+    )
+
+    user_settings: UserSettings
 
     delivery_preview_outputs: list[PreviewOutput]
     delivery_sequence_outputs: list[SequenceOutput]
@@ -48,10 +109,10 @@ class Settings:
     preview_colorspace_odt: str
     sequence_colorspace: str
 
-    add_slate_to_sequence: bool = False
-    override_preview_submission_note: bool = False
-    continuous_versioning: bool = False
-    remove_alpha_from_sequence: bool = True
+    add_slate_to_sequence: bool
+    override_preview_submission_note: bool
+    continuous_versioning: bool
+    remove_alpha_from_sequence: bool
 
     slate_extra_fields: dict[str, TemplateString | FieldTemplateString | str]
 
@@ -62,31 +123,29 @@ class Settings:
 
     def __init__(self, app):
         self._app = app
+        self.user_settings = UserSettings()
 
         self._app.logger.info("========= Loading Settings ========")
 
-        delivery_preview_outputs = self._app.get_setting(
-            "delivery_preview_outputs"
+        self.delivery_preview_outputs = self._load_list_setting(
+            "delivery_preview_outputs", PreviewOutput.from_dict
         )
-        self.delivery_preview_outputs = []
-        for output in delivery_preview_outputs:
-            self.delivery_preview_outputs.append(
-                PreviewOutput.from_dict(output)
-            )
-
-        delivery_sequence_outputs = self._app.get_setting(
-            "delivery_sequence_outputs"
+        self.delivery_sequence_outputs = self._load_list_setting(
+            "delivery_sequence_outputs", SequenceOutput.from_dict
         )
-        self.delivery_sequence_outputs = []
-        for output in delivery_sequence_outputs:
-            self.delivery_sequence_outputs.append(
-                SequenceOutput.from_dict(output)
-            )
+        self.version_overrides = self._load_list_setting(
+            "version_overrides", VersionOverride.from_dict
+        )
+
+        # The overrides are grouped by entity type once here, so the
+        # per-entity lookup in the cache processing is a dict read
+        self._overrides_by_type = {}
+        for override in self.version_overrides:
+            self._overrides_by_type.setdefault(
+                override.entity_type, []
+            ).append(override)
 
-        version_overrides = self._app.get_setting("version_overrides")
-        self.version_overrides = []
-        for output in version_overrides:
-            self.version_overrides.append(VersionOverride.from_dict(output))
+        self._extra_fields_cache = None
 
         default_csv = self._app.get_setting("default_csv", {})
         self.default_csv = {}
@@ -97,16 +156,24 @@ class Settings:
 
             self.default_csv[key] = FieldTemplateString(default_csv[key])
 
-        keys = {
-            "width": IntegerKey("width", default=0),
-            "height": IntegerKey("height", default=0),
-            "aspect_ratio": StringKey("aspect_ratio", default="1"),
-        }
         # Loop through all template objects and collect their keys
         # This only gets the keys that are used in actual templates.
-        for template in self._app.sgtk.templates.values():
-            for key, value in template.keys.items():
-                keys[key] = value
+        cached = _MERGED_KEYS_CACHE.get(self._app.sgtk)
+        if cached is None:
+            keys = {
+                "width": IntegerKey("width", default=0),
+                "height": IntegerKey("height", default=0),
+                "aspect_ratio": StringKey("aspect_ratio", default="1"),
+            }
+            for template in self._app.sgtk.templates.values():
+                keys.update(template.keys)
+            template_string_cache = {}
+            _MERGED_KEYS_CACHE[self._app.sgtk] = (
+                keys,
+                template_string_cache,
+            )
+        else:
+            keys, template_string_cache = cached
 
         slate_extra_fields = self._app.get_setting("slate_extra_fields")
         self.slate_extra_fields = {}
@@ -116,7 +183,9 @@ class Settings:
                 self._app.logger.debug(
                     "  Template String - %s: %s", key, value
                 )
-                self.slate_extra_fields[key] = TemplateString(value, keys, key)
+                self.slate_extra_fields[key] = _get_template_string(
+                    value, key, keys, template_string_cache
+                )
             elif "<" in value and ">" in value:
                 self._app.logger.debug(
                     "  Field Template String - %s: %s", key, value
@@ -159,6 +228,16 @@ class Settings:
 
         self._app.logger.info("=" * 35)
 
+    def _load_list_setting(self, name: str, factory) -> list:
+        """
+        Load a list setting and construct an object per entry.
+
+        Args:
+            name: Name of the setting
+            factory: Callable that creates an object from a settings dict
+        """
+        return [factory(data) for data in self._app.get_setting(name)]
+
     def get_version_overrides(self, entity_type: str) -> list[VersionOverride]:
         """
         Get a list of VersionOverrides for a specific entity type
@@ -166,11 +245,7 @@ class Settings:
         Args:
             entity_type: Entity type to filter
         """
-        return [
-            override
-            for override in self.version_overrides
-            if override.entity_type == entity_type
-        ]
+        return self._overrides_by_type.get(entity_type, [])
 
     def get_slate_extra_fields(self, fields: dict, context: Context):
         """
@@ -209,7 +284,13 @@ class Settings:
     def compile_extra_fields(self):
         """
         Get a dict of all extra fields to request from ShotGrid for specific entities.
+
+        Settings don't change after construction, so the compiled dict is
+        computed once and reused.
         """
+        if self._extra_fields_cache is not None:
+            return self._extra_fields_cache
+
         extra_fields: dict[str, list[str]] = {
             "Project": [
                 self.show_name_field,
@@ -266,6 +347,7 @@ class Settings:
                 field for field in fields if field is not None
             ]
 
+        self._extra_fields_cache = extra_fields
         return extra_fields
 
     def validate_fields(self):
@@ -276,7 +358,7 @@ class Settings:
         extra_fields = self.compile_extra_fields()
 
         for entity_type, fields in extra_fields.items():
-            schema = self._app.shotgun.schema_field_read(entity_type)
+            schema = get_schema(self._app.shotgun, entity_type)
 
             for field in fields:
                 if field not in schema:
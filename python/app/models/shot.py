@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from .entity import Entity, EntityType
@@ -8,8 +9,44 @@ if TYPE_CHECKING:
     from ..models.version import Version
     from .footage_format import FootageFormat
 
+_VERSION_NUMBER_KEY = attrgetter("version_number")
+
 
 class Shot(Entity):
+    __slots__ = (
+        "episode",
+        "sequence",
+        "code",
+        "id",
+        "description",
+        "vfx_scope_of_work",
+        "project_code",
+        "footage_formats",
+        "progress",
+        "validation_message",
+        "validation_error",
+        "_versions",
+        "_sorted",
+        "_footage_format_dicts",
+    )
+
+    # Fields that get() can answer with a plain attribute read, without
+    # serializing every version and footage format
+    _SCALAR_FIELDS = frozenset(
+        (
+            "episode",
+            "sequence",
+            "code",
+            "id",
+            "description",
+            "vfx_scope_of_work",
+            "project_code",
+            "progress",
+            "validation_message",
+            "validation_error",
+        )
+    )
+
     episode: str | None
     sequence: str
     code: str
@@ -46,15 +83,28 @@ class Shot(Entity):
         self.progress = 0
 
         self._versions = []
+        self._sorted = True
+        self._footage_format_dicts = None
 
     def get_versions(self) -> list[Version]:
+        # Versions are sorted lazily on first read instead of on every add
+        if not self._sorted:
+            self._versions.sort(key=_VERSION_NUMBER_KEY)
+            self._sorted = True
         return self._versions
 
     def add_version(self, version: Version):
         self._versions.append(version)
-        self._versions = sorted(self._versions, key=lambda v: v.version_number)
+        self._sorted = False
 
     def as_dict(self) -> dict:
+        # Footage formats don't change after construction, so their
+        # serialization is cached on first use
+        if self._footage_format_dicts is None:
+            self._footage_format_dicts = [
+                fformat.as_dict() for fformat in self.footage_formats
+            ]
+
         return {
             "episode": self.episode,
             "sequence": self.sequence,
@@ -64,14 +114,16 @@ class Shot(Entity):
             "vfx_scope_of_work": self.vfx_scope_of_work,
             "project_code": self.project_code,
             "progress": self.progress,
-            "versions": [version.as_dict() for version in self._versions],
-            "footage_formats": [
-                fformat.as_dict() for fformat in self.footage_formats
+            "versions": [
+                version.as_dict() for version in self.get_versions()
             ],
+            "footage_formats": self._footage_format_dicts,
         }
 
     def get(self, key: str):
         """
         Return the value for key if key is in the dictionary, else default.
         """
+        if key in self._SCALAR_FIELDS:
+            return getattr(self, key, None)
         return self.as_dict().get(key)
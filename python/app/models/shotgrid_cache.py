@@ -5,6 +5,7 @@ import json
 import sgtk
 
 from .context import Context
+from .util import get_schema
 
 
 class ShotGridCache:
@@ -22,6 +23,11 @@ class ShotGridCache:
         self.sg_cache = {}
         self.fields = {}
 
+        # Lazy id -> entity indexes over the cached lists, rebuilt when
+        # the underlying list for an entity type changes
+        self._raw_index = {}
+        self._index = {}
+
     def load(self):
         self.logger.info("Loading ShotGrid cache...")
         project_id = self.context.project["id"]
@@ -61,10 +67,11 @@ class ShotGridCache:
 
         shot_ids = {version["entity"]["id"] for version in versions}
 
-        for shot_id in shot_ids:
+        # One batched query instead of one round trip per shot
+        if shot_ids:
             self.find_raw(
                 "Shot",
-                [["id", "is", shot_id]],
+                [["id", "in", list(shot_ids)]],
             )
         self.logger.info("Found %s shots", len(shot_ids))
 
@@ -72,18 +79,17 @@ class ShotGridCache:
             "PublishedFileType",
             [["code", "is", "Rendered Image"]],
         )
-        for version in versions:
-            publishes = version.get("published_files", [])
 
-            if len(publishes) == 0:
-                continue
+        published_ids = {
+            pub["id"]
+            for version in versions
+            for pub in version.get("published_files", [])
+        }
 
+        # Same batching for the published files of all versions
+        if published_ids:
             filters = [
-                [
-                    "id",
-                    "in",
-                    [pub["id"] for pub in publishes],
-                ],
+                ["id", "in", list(published_ids)],
                 ["published_file_type", "is", published_file_type],
             ]
 
@@ -104,15 +110,13 @@ class ShotGridCache:
             self._nested_set(
                 self.sg_cache, [entity_type, "entities"], processed_entities
             )
+            self._index.pop(entity_type, None)
         self.logger.info("Processed all cached ShotGrid data.")
 
     def find_raw(self, entity_type: str, filters: list) -> list[dict] | None:
-        if entity_type in self.fields:
-            fields = self.fields[entity_type]
-        else:
-            fields = list(
-                self.connection.schema_field_read(entity_type).keys()
-            )
+        fields = self.fields.get(entity_type)
+        if fields is None:
+            fields = list(get_schema(self.connection, entity_type).keys())
             self.fields[entity_type] = fields
 
         entities = self.connection.find(entity_type, filters, fields)
@@ -129,6 +133,7 @@ class ShotGridCache:
         self._nested_set(
             self.sg_cache, [entity_type, "raw_entities"], raw_entities
         )
+        self._raw_index.pop(entity_type, None)
 
         return entities
 
@@ -165,6 +170,7 @@ class ShotGridCache:
         self._nested_set(
             self.sg_cache, [entity_type, "entities"], processed_entities
         )
+        self._index.pop(entity_type, None)
 
         self.logger.info("Found %s %ss", len(entities), entity_type)
         return entities
@@ -183,6 +189,32 @@ class ShotGridCache:
     def get(self, entity_type: str):
         return self.sg_cache.get(entity_type, {}).get("entities", [])
 
+    def get_raw_by_id(self, entity_type: str) -> dict[int, dict]:
+        """
+        Get the raw entities of an entity type indexed by id. The index
+        is built lazily and reused until the cached list changes.
+        """
+        index = self._raw_index.get(entity_type)
+        if index is None:
+            index = {
+                entity["id"]: entity for entity in self.get_raw(entity_type)
+            }
+            self._raw_index[entity_type] = index
+        return index
+
+    def get_by_id(self, entity_type: str) -> dict[int, dict]:
+        """
+        Get the processed entities of an entity type indexed by id. The
+        index is built lazily and reused until the cached list changes.
+        """
+        index = self._index.get(entity_type)
+        if index is None:
+            index = {
+                entity["id"]: entity for entity in self.get(entity_type)
+            }
+            self._index[entity_type] = index
+        return index
+
     def _process_entity_overrides(
         self, entity_type: str, entities: dict | list
     ) -> dict | list:
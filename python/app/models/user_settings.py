@@ -8,24 +8,34 @@ if TYPE_CHECKING:
 
 
 class UserSettings:
-    delivery_version: int = None
-    delivery_location: str = None
-    letterbox: Letterbox = None
-    delivery_preview_outputs: list[PreviewOutput] = None
+    __slots__ = (
+        "delivery_version",
+        "delivery_location",
+        "letterbox",
+        "delivery_preview_outputs",
+        "csv_fields",
+    )
+
+    delivery_version: int | None
+    delivery_location: str | None
+    letterbox: Letterbox | None
+    delivery_preview_outputs: list[PreviewOutput] | None
     csv_fields: list[tuple[str, FieldTemplateString]]
 
+    def __init__(self):
+        self.delivery_version = None
+        self.delivery_location = None
+        self.letterbox = None
+        self.delivery_preview_outputs = None
+
     def get_csv_entities(self) -> list[tuple[str, list[str]]]:
         """
         Get a set of the unique csv entities that are requested
         """
-        templates = [template for key, template in self.csv_fields]
         entities: dict[str, list[str]] = {}
 
-        for template in templates:
+        for _key, template in self.csv_fields:
             for entity, fields in template.ordered_fields.items():
-                if entity in entities:
-                    entities[entity].extend(fields)
-                else:
-                    entities[entity] = fields
+                entities.setdefault(entity, []).extend(fields)
 
         return list(entities.items())
@@ -1,40 +1,90 @@
 from __future__ import annotations
 
+import weakref
+from functools import lru_cache
+
 import sgtk
 
 logger = sgtk.platform.get_logger(__name__)
 
+_SENTINEL = object()
+
+
+@lru_cache(maxsize=4096)
+def _split_field(field: str) -> tuple[str, ...]:
+    """
+    Split a dot separated field path once and reuse it; the same handful
+    of paths is resolved against thousands of entities.
+    """
+    return tuple(field.split("."))
+
+# Schema reads are network round trips to ShotGrid, and the schema doesn't
+# change while the app is running. Weakly keyed by connection, so schemas
+# aren't shared between sites and die with the connection instead of
+# lingering for a recycled one.
+_SCHEMA_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_schema(connection, entity_type: str) -> dict:
+    """
+    Get the field schema of an entity type, reading it from ShotGrid only
+    once per connection and entity type.
+    """
+    schemas = _SCHEMA_CACHE.get(connection)
+    if schemas is None:
+        schemas = {}
+        _SCHEMA_CACHE[connection] = schemas
+
+    schema = schemas.get(entity_type)
+    if schema is None:
+        schema = connection.schema_field_read(entity_type)
+        schemas[entity_type] = schema
+    return schema
+
 
-def get_nested_value(field: str, data: dict, raise_exception=False):
+def get_nested_value(
+    field: str | tuple[str, ...], data: dict, raise_exception=False
+):
     """
     Get the value of a dot separated key list in a dict
+
+    The field can be passed pre-split as a tuple to avoid splitting the
+    same path on every call.
     """
-    keys = field.split(".")
+    keys = _split_field(field) if isinstance(field, str) else field
     value = data
 
+    # ShotGrid data is plain dicts and lists, so exact type checks and a
+    # sentinel dict.get (one hash probe instead of `in` + lookup) are safe
     for key in keys:
-        if isinstance(value, dict) and key in value:
-            value = value[key]
+        if type(value) is dict:
+            value = value.get(key, _SENTINEL)
+            if value is not _SENTINEL:
+                continue
         elif (
-            isinstance(value, list)
+            type(value) is list
             and len(value) > 0
-            and isinstance(value[0], dict)
-            and key in value[0]
+            and type(value[0]) is dict
         ):
-            value = value[0][key]
-        else:
-            if raise_exception:
-                raise Exception
-            return None  # Key path does not exist
+            value = value[0].get(key, _SENTINEL)
+            if value is not _SENTINEL:
+                continue
+
+        if raise_exception:
+            raise Exception
+        return None  # Key path does not exist
 
     return value
 
 
-def set_nested_value(data: dict, field: str, value: str):
+def set_nested_value(data: dict, field: str | tuple[str, ...], value: str):
     """
     Set the value of a dot separated key list in a dict
+
+    The field can be passed pre-split as a tuple to avoid splitting the
+    same path on every call.
     """
-    keys = field.split(".")
+    keys = _split_field(field) if isinstance(field, str) else field
     d = data
 
     for key in keys[:-1]:  # Traverse down to the second-last key
@@ -52,16 +102,12 @@ def compile_extra_template_fields(
     if base_fields is not None:
         fields = base_fields
 
+    # The id indexes make these O(1) lookups instead of a linear scan
+    # over every cached entity per call
     sg_project = cache.get("Project")[0]
-    sg_shot = next(
-        (s for s in cache.get("Shot") if s.get("id") == entity.id), None
-    )
-    sg_asset = next(
-        (s for s in cache.get("Asset") if s.get("id") == entity.id), None
-    )
-    sg_version = next(
-        v for v in cache.get("Version") if v.get("id") == version.id
-    )
+    sg_shot = cache.get_by_id("Shot").get(entity.id)
+    sg_asset = cache.get_by_id("Asset").get(entity.id)
+    sg_version = cache.get_by_id("Version")[version.id]
 
     for key in template.keys.values():
         if (
@@ -1,7 +1,39 @@
 from __future__ import annotations
 
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .settings import Settings
+
 
 class Version:
+    __slots__ = (
+        "id",
+        "id_str",
+        "code",
+        "first_frame",
+        "last_frame",
+        "fps",
+        "version_number",
+        "thumbnail",
+        "sequence_path",
+        "path_to_movie",
+        "frames_have_slate",
+        "movie_has_slate",
+        "task",
+        "submitting_for",
+        "submission_note",
+        "submission_note_short",
+        "attachment",
+        "deliver_preview",
+        "deliver_sequence",
+        "sequence_output_status",
+        "validation_message",
+        "validation_error",
+        "progress",
+    )
+
     id: int
     id_str: str
     code: str
@@ -18,6 +50,7 @@ class Version:
     submitting_for: str
     submission_note: str
     submission_note_short: str
+    attachment: dict | None
 
     deliver_preview: bool
     deliver_sequence: bool
@@ -61,18 +94,16 @@ class Version:
         self.frames_have_slate = frames_have_slate
         self.movie_has_slate = movie_has_slate
 
-        if sequence_path and sequence_path != "":
-            self.sequence_path = sequence_path
-        else:
-            self.sequence_path = None
-
-        if path_to_movie and path_to_movie != "":
-            self.path_to_movie = path_to_movie
-        else:
-            self.path_to_movie = None
+        self.sequence_path = sequence_path or None
+        self.path_to_movie = path_to_movie or None
 
         self.task = task
-        self.submitting_for = submitting_for
+        # These fields hold one of a handful of repeated values across all
+        # versions; interning shares the storage and makes comparisons a
+        # pointer check
+        self.submitting_for = (
+            sys.intern(submitting_for) if submitting_for else submitting_for
+        )
         self.submission_note = submission_note
         self.submission_note_short = submission_note_short
         self.attachment = attachment
@@ -80,48 +111,129 @@ class Version:
         self.deliver_preview = deliver_preview
         self.deliver_sequence = deliver_sequence
 
-        self.sequence_output_status = sequence_output_status
+        self.sequence_output_status = (
+            sys.intern(sequence_output_status)
+            if sequence_output_status
+            else sequence_output_status
+        )
 
         self.validation_message = ""
         self.validation_error = ""
         self.progress = 0
 
+    @classmethod
+    def from_sg(
+        cls,
+        sg_version: dict,
+        settings: Settings,
+        sequence_path: str,
+        version_number: int,
+        deliver_preview: bool,
+        deliver_sequence: bool,
+    ) -> Version:
+        """
+        Build a Version straight from a ShotGrid version dict.
+
+        Bypasses __init__'s keyword parsing and default handling, which
+        adds up when hundreds of versions are built from query results.
+        Values derived from the published file are passed in by the
+        caller.
+        """
+        version = cls.__new__(cls)
+        version.id = sg_version["id"]
+        version.id_str = str(sg_version["id"])
+        version.code = sg_version["code"]
+        version.first_frame = sg_version["sg_first_frame"]
+        version.last_frame = sg_version["sg_last_frame"]
+        version.fps = sg_version["sg_uploaded_movie_frame_rate"]
+        version.version_number = max(0, int(version_number))
+        version.thumbnail = sg_version["image"]
+        version.frames_have_slate = sg_version["sg_frames_have_slate"]
+        version.movie_has_slate = sg_version["sg_movie_has_slate"]
+        version.sequence_path = sequence_path or None
+        version.path_to_movie = sg_version["sg_path_to_movie"] or None
+        sg_task = sg_version["sg_task"]
+        version.task = (
+            Task(sg_task["id"], sg_task["name"])
+            if sg_task is not None
+            else None
+        )
+        submitting_for = sg_version.get(settings.submitting_for_field, "")
+        version.submitting_for = (
+            sys.intern(submitting_for) if submitting_for else submitting_for
+        )
+        version.submission_note = sg_version.get(
+            settings.submission_note_field, ""
+        )
+        version.submission_note_short = sg_version.get(
+            settings.short_submission_note_field, ""
+        )
+        version.attachment = sg_version.get(settings.attachment_field, "")
+        version.deliver_preview = deliver_preview
+        version.deliver_sequence = deliver_sequence
+        sequence_output_status = sg_version.get(
+            settings.delivery_sequence_outputs_field, ""
+        )
+        version.sequence_output_status = (
+            sys.intern(sequence_output_status)
+            if sequence_output_status
+            else sequence_output_status
+        )
+        version.validation_message = ""
+        version.validation_error = ""
+        version.progress = 0
+        return version
+
+    # Field order of as_dict, cached at class level so the dict can be
+    # built with a single comprehension
+    _DICT_FIELDS = (
+        "id",
+        "id_str",
+        "code",
+        "first_frame",
+        "last_frame",
+        "fps",
+        "version_number",
+        "thumbnail",
+        "sequence_path",
+        "path_to_movie",
+        "frames_have_slate",
+        "movie_has_slate",
+        "task",
+        "submitting_for",
+        "submission_note",
+        "submission_note_short",
+        "deliver_preview",
+        "deliver_sequence",
+        "sequence_output_status",
+        "validation_message",
+        "validation_error",
+        "progress",
+    )
+
+    # Every field except the serialized task is a plain attribute, so
+    # get() can answer them without building the whole dict
+    _SCALAR_FIELDS = frozenset(_DICT_FIELDS) - {"task"}
+
     def as_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "id_str": self.id_str,
-            "code": self.code,
-            "first_frame": self.first_frame,
-            "last_frame": self.last_frame,
-            "fps": self.fps,
-            "version_number": self.version_number,
-            "thumbnail": self.thumbnail,
-            "sequence_path": self.sequence_path,
-            "path_to_movie": self.path_to_movie,
-            "frames_have_slate": self.frames_have_slate,
-            "movie_has_slate": self.movie_has_slate,
-            "task": (
-                self.task.as_dict() if self.task is not None else "undefined"
-            ),
-            "submitting_for": self.submitting_for,
-            "submission_note": self.submission_note,
-            "submission_note_short": self.submission_note_short,
-            "deliver_preview": self.deliver_preview,
-            "deliver_sequence": self.deliver_sequence,
-            "sequence_output_status": self.sequence_output_status,
-            "validation_message": self.validation_message,
-            "validation_error": self.validation_error,
-            "progress": self.progress,
-        }
+        data = {key: getattr(self, key) for key in self._DICT_FIELDS}
+        data["task"] = (
+            self.task.as_dict() if self.task is not None else "undefined"
+        )
+        return data
 
     def get(self, key: str):
         """
         Return the value for key if key is in the dictionary, else default.
         """
+        if key in self._SCALAR_FIELDS:
+            return getattr(self, key, None)
         return self.as_dict().get(key)
 
 
 class Task:
+    __slots__ = ("id", "name")
+
     id: int
     name: str
 
@@ -129,14 +241,14 @@ class Task:
         self.id = id
         self.name = name
 
+    _DICT_FIELDS = ("id", "name")
+
     def as_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "name": self.name,
-        }
+        return {key: getattr(self, key) for key in self._DICT_FIELDS}
 
     def get(self, key: str):
         """
         Return the value for key if key is in the dictionary, else default.
         """
-        return self.as_dict().get(key)
+        # Both fields are plain attributes; no need for the dict round trip
+        return getattr(self, key, None)
@@ -14,6 +14,14 @@ class VersionOverride:
     A list of overrides to apply to an entity of a version, matched against ShotGrid fields.
     """
 
+    __slots__ = (
+        "entity_type",
+        "match",
+        "replace",
+        "_match_paths",
+        "_replace_paths",
+    )
+
     entity_type: str
     match: dict
     replace: dict[str, FieldTemplateString]
@@ -23,6 +31,17 @@ class VersionOverride:
         self.match = match or {}
         self.replace = replace or {}
 
+        # Pre-split the dot separated field paths once, so applying the
+        # override to many entities doesn't re-split them per entity
+        self._match_paths = [
+            (tuple(field.split(".")), value)
+            for field, value in self.match.items()
+        ]
+        self._replace_paths = [
+            (tuple(field.split(".")), template)
+            for field, template in self.replace.items()
+        ]
+
     def process(self, entity: dict, context: Context):
         """
         Apply the override to an entity.
@@ -31,29 +50,33 @@ class VersionOverride:
             entity: Entity dict
             context: Context to resolve templates with
         """
-        match = len(self.match.keys()) == 0
-
-        for field, value in self.match.items():
-            entity_value = util.get_nested_value(field, entity)
-
-            # Skip field if not found in entity
+        # Fields that are not found in the entity are skipped, but at
+        # least one field must be found and every found field must
+        # match; an entity where nothing resolves is left alone. The
+        # loop short-circuits on the first mismatch.
+        get_nested_value = util.get_nested_value
+        match = len(self._match_paths) == 0
+        for path, value in self._match_paths:
+            entity_value = get_nested_value(path, entity)
             if entity_value is None:
                 continue
-
-            match = entity_value == value
+            if entity_value != value:
+                match = False
+                break
+            match = True
 
         if match:
-            for field, template in self.replace.items():
+            for path, template in self._replace_paths:
                 # TODO add field template support
                 try:
                     util.set_nested_value(
                         entity,
-                        field,
+                        path,
                         template.apply_context(context),
                     )
                 except Exception:
                     logger.error(traceback.format_exc())
-                    util.set_nested_value(entity, field, "")
+                    util.set_nested_value(entity, path, "")
 
         return entity
 
@@ -61,7 +84,7 @@ class VersionOverride:
         """
         Get a list of the fields used for matching.
         """
-        return [key.split(".")[0] for key in self.match]
+        return [path[0] for path, _value in self._match_paths]
 
     @staticmethod
     def from_dict(data: dict):
@@ -70,7 +93,8 @@ class VersionOverride:
         replace = data.get("replace", {})
 
         replace = {
-            key: FieldTemplateString(value) for key, value in replace.items()
+            key: FieldTemplateString.get(value)
+            for key, value in replace.items()
         }
 
         return VersionOverride(